@@ -3,13 +3,30 @@ Sistema de Processamento de Dados Governamentais
 Processa dados de entrada, realiza análises estatísticas e gera relatórios.
 """
 
+import argparse
 import os
 import pandas as pd
 import numpy as np
 from datetime import datetime
-import warnings
 
-warnings.filterwarnings('ignore')
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pa_csv
+except ImportError:
+    pa = None
+
+try:
+    import polars as pl
+except ImportError:
+    pl = None
+
+# Abreviações dos meses (as mesmas de strftime('%b') no locale C)
+MESES = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
+         'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
+# Tipo categórico ordenado de 'mes_nome': agrupamentos usam os códigos int8
+# em vez do hash de strings e respeitam a ordem do calendário
+MESES_DTYPE = pd.CategoricalDtype(categories=MESES, ordered=True)
 
 
 def formatar_tabela(df, espacamento_colunas=3):
@@ -26,45 +43,253 @@ def formatar_tabela(df, espacamento_colunas=3):
     if df.empty:
         return ""
     
-    # Converter DataFrame para string com espaçamento
-    output = []
-    colunas = df.columns.tolist()
+    # Converter DataFrame para string uma única vez; larguras e preenchimento
+    # são feitos pelas rotinas vetorizadas de np.char sobre o array inteiro
+    colunas = np.asarray([str(col) for col in df.columns], dtype=str)
+    valores = df.astype(str).to_numpy(dtype=str)
     
     # Calcular largura de cada coluna
-    larguras = {}
-    for col in colunas:
-        larguras[col] = max(
-            len(str(col)),
-            df[col].astype(str).str.len().max() if len(df) > 0 else 0
-        )
+    larguras = np.maximum(
+        np.char.str_len(colunas),
+        np.char.str_len(valores).max(axis=0)
+    ) + espacamento_colunas
     
     # Cabeçalho
-    header = "  ".join([str(col).ljust(larguras[col] + espacamento_colunas) for col in colunas])
-    output.append(header)
-    output.append("-" * len(header))
+    header = "  ".join(np.char.ljust(colunas, larguras).tolist())
+    output = [header, "-" * len(header)]
     
-    # Linhas de dados
-    for idx, row in df.iterrows():
-        linha = "  ".join([
-            str(row[col]).ljust(larguras[col] + espacamento_colunas) 
-            for col in colunas
-        ])
-        output.append(linha)
+    # Linhas de dados (largura de cada coluna aplicada por broadcasting)
+    output.extend("  ".join(linha) for linha in np.char.ljust(valores, larguras).tolist())
     
     return "\n".join(output)
 
 
-def processar_dados(arquivo_entrada, arquivo_saida):
+def ler_csv(arquivo_entrada, engine='auto'):
+    """
+    Lê o CSV de entrada (separador ';', milhar ',') em um DataFrame.
+
+    Com engine='pyarrow' (ou 'auto' com pyarrow instalado) usa o leitor
+    multithread do Arrow; com engine='pandas' usa pd.read_csv.
+
+    Args:
+        arquivo_entrada (str): Caminho do arquivo CSV de entrada
+        engine (str): 'auto', 'pyarrow' ou 'pandas'
+
+    Returns:
+        pd.DataFrame: DataFrame com os dados lidos
+    """
+    if engine not in ('auto', 'pyarrow', 'pandas'):
+        raise ValueError(f"Engine de leitura invalida: {engine}")
+    if engine == 'pyarrow' and pa is None:
+        raise ImportError("pyarrow nao esta instalado")
+
+    if engine == 'pandas' or pa is None:
+        return pd.read_csv(arquivo_entrada, sep=';', thousands=',')
+
+    tabela = pa_csv.read_csv(
+        arquivo_entrada,
+        read_options=pa_csv.ReadOptions(block_size=64 << 20, use_threads=True),
+        parse_options=pa_csv.ParseOptions(delimiter=';'),
+        # Células vazias viram nulo também em colunas de texto, como no pandas
+        convert_options=pa_csv.ConvertOptions(strings_can_be_null=True),
+    )
+
+    # Arrow nao tem opcao de separador de milhar: colunas de texto como
+    # "1,234" (ou " 1,234 ", com espacos) sao convertidas aqui, as demais
+    # permanecem como texto
+    for i, campo in enumerate(tabela.schema):
+        if pa.types.is_null(campo.type):
+            # Coluna totalmente vazia: float NaN, como no pandas
+            tabela = tabela.set_column(i, campo.name, pc.cast(tabela.column(i), pa.float64()))
+            continue
+        if not pa.types.is_string(campo.type):
+            continue
+        sem_milhar = pc.utf8_trim_whitespace(pc.replace_substring(tabela.column(i), ',', ''))
+        for tipo in (pa.int64(), pa.float64()):
+            try:
+                tabela = tabela.set_column(i, campo.name, pc.cast(sem_milhar, tipo))
+                break
+            except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+                continue
+
+    return tabela.to_pandas(self_destruct=True, split_blocks=True)
+
+
+def calcular_estatisticas_gerais(valores):
+    """
+    Calcula as estatísticas descritivas de uma série numérica sobre o array
+    NumPy, com uma única remoção de nulos para todas as reduções.
+
+    Args:
+        valores (pd.Series): Valores numéricos (nulos são ignorados)
+
+    Returns:
+        dict: registros, soma, media, mediana, desvio_padrao, minimo, maximo
+            e negativos
+    """
+    v = valores.to_numpy()
+    if v.dtype.kind == 'f':
+        v = v[~np.isnan(v)]
+    n = len(v)
+
+    if n == 0:
+        return {
+            'registros': 0, 'soma': v.dtype.type(0), 'media': np.nan, 'mediana': np.nan,
+            'desvio_padrao': np.nan, 'minimo': np.nan, 'maximo': np.nan, 'negativos': 0
+        }
+
+    soma = v.sum()
+    media = soma / n
+    # Mediana em O(n) com partição parcial em vez de ordenação completa
+    meio = n // 2
+    if n % 2:
+        mediana = float(np.partition(v, meio)[meio])
+    else:
+        particao = np.partition(v, [meio - 1, meio])
+        mediana = (float(particao[meio - 1]) + float(particao[meio])) / 2
+
+    return {
+        'registros': n,
+        'soma': soma,
+        'media': float(media),
+        'mediana': mediana,
+        'desvio_padrao': float(np.std(v, ddof=1)) if n > 1 else np.nan,
+        'minimo': v.min(),
+        'maximo': v.max(),
+        'negativos': np.count_nonzero(v < 0)
+    }
+
+
+def calcular_estatisticas_ano(df):
+    """
+    Agrega a coluna 'valor' por ano em uma única passagem.
+
+    Args:
+        df (pd.DataFrame): DataFrame com as colunas 'ano' e 'valor'
+
+    Returns:
+        pd.DataFrame: Estatísticas por ano (count, mean, sum, min, max, std, median)
+    """
+    return df.groupby('ano', sort=True)['valor'].agg(
+        ['count', 'mean', 'sum', 'min', 'max', 'std', 'median']
+    )
+
+
+def calcular_estatisticas_mes(df):
+    """
+    Agrega a coluna 'valor' por nome do mês em uma única passagem.
+
+    Args:
+        df (pd.DataFrame): DataFrame com as colunas 'mes_nome' e 'valor'
+
+    Returns:
+        pd.DataFrame: Estatísticas por mês (count, mean, sum, median)
+    """
+    return df.groupby('mes_nome', sort=True, observed=True)['valor'].agg(
+        ['count', 'mean', 'sum', 'median']
+    )
+
+
+def agregar_folhas(df):
+    """
+    Calcula as estatísticas suficientes de 'valor' por (ano, mes_nome).
+
+    Usada pelo modo em blocos, em que as folhas de cada bloco são
+    combinadas sem manter os dados em memória.
+
+    Args:
+        df (pd.DataFrame): DataFrame com as colunas 'ano', 'mes_nome' e 'valor'
+
+    Returns:
+        pd.DataFrame: Folhas com as colunas (count, sum, mean, m2, min, max)
+    """
+    folhas = df.groupby(['ano', 'mes_nome'], sort=True, observed=True)['valor'].agg(
+        ['count', 'sum', 'mean', 'var', 'min', 'max']
+    )
+    folhas['m2'] = (folhas['var'] * (folhas['count'] - 1)).fillna(0)
+    return folhas[['count', 'sum', 'mean', 'm2', 'min', 'max']]
+
+
+def combinar_folhas(folhas, nivel):
+    """
+    Combina estatísticas suficientes agrupando por um ou mais níveis do índice.
+
+    Args:
+        folhas (pd.DataFrame): Estatísticas com as colunas (count, sum, mean, m2, min, max)
+        nivel (str | list): Nível (ou níveis) do índice usado no agrupamento
+
+    Returns:
+        pd.DataFrame: Estatísticas (count, sum, mean, m2, min, max, std) do nível
+    """
+    grupos = folhas.groupby(level=nivel, sort=True, observed=True)
+    stats = grupos.agg(
+        count=('count', 'sum'),
+        sum=('sum', 'sum'),
+        min=('min', 'min'),
+        max=('max', 'max')
+    )
+    stats['mean'] = stats['sum'] / stats['count']
+
+    # Combinação de variâncias (Chan et al.): M2 = soma(M2_i) + soma(n_i * (media_i - media)^2)
+    media_nivel = grupos['sum'].transform('sum') / grupos['count'].transform('sum')
+    m2 = folhas['m2'] + (folhas['count'] * (folhas['mean'] - media_nivel) ** 2).fillna(0)
+    stats['m2'] = m2.groupby(level=nivel, sort=True, observed=True).sum()
+    stats['std'] = np.sqrt(stats['m2'] / (stats['count'] - 1)).where(stats['count'] > 1)
+
+    return stats[['count', 'sum', 'mean', 'm2', 'min', 'max', 'std']]
+
+
+def calcular_tendencias_ano(anos, somas, registros, n_top=5):
+    """
+    Calcula crescimento ano a ano, ranking e totais por década sobre arrays.
+
+    Args:
+        anos (np.ndarray): Anos em ordem crescente
+        somas (np.ndarray): Soma dos valores de cada ano
+        registros (np.ndarray): Quantidade de registros de cada ano
+        n_top (int): Quantidade de anos no ranking
+
+    Returns:
+        tuple: (crescimento, top, decadas, soma_decada, registros_decada), onde
+            crescimento[i] é a taxa (%) de anos[i] para anos[i+1] (NaN quando a
+            soma anterior não é positiva) e top são os índices dos maiores anos
+    """
+    anteriores = somas[:-1]
+    validos = anteriores > 0
+    crescimento = np.full(len(anteriores), np.nan)
+    crescimento[validos] = (somas[1:][validos] - anteriores[validos]) / anteriores[validos] * 100
+
+    top = np.argsort(-somas, kind='stable')[:n_top]
+
+    decadas, inicio = np.unique((anos // 10) * 10, return_index=True)
+    soma_decada = np.add.reduceat(somas, inicio)
+    registros_decada = np.add.reduceat(registros, inicio)
+
+    return crescimento, top, decadas, soma_decada, registros_decada
+
+
+def processar_dados(arquivo_entrada, arquivo_saida, engine='auto',
+                    formato_saida=('csv', 'parquet'), excel=False,
+                    retornar_estatisticas=False):
     """
     Processa dados de entrada, realiza limpeza e transformações.
     
     Args:
         arquivo_entrada (str): Caminho do arquivo CSV de entrada
         arquivo_saida (str): Caminho do arquivo CSV de saída
+        engine (str): Leitor do CSV ('auto', 'pyarrow' ou 'pandas')
+        formato_saida (tuple): Formatos gravados ('csv' e/ou 'parquet')
+        excel (bool): Se True, grava também uma versão Excel (.xlsx)
+        retornar_estatisticas (bool): Se True, retorna também as estatísticas
+            por ano e por mês calculadas na etapa 6
         
     Returns:
-        pd.DataFrame: DataFrame com dados processados ou None em caso de erro
+        pd.DataFrame: DataFrame com dados processados ou None em caso de erro.
+            Com retornar_estatisticas=True, retorna a tupla
+            (df, stats_ano, stats_mes), ou (None, None, None) em caso de erro
     """
+    erro = (None, None, None) if retornar_estatisticas else None
+
     print()
     print("=" * 80)
     print(" " * 25 + "PROCESSAMENTO DE DADOS DO GOVERNO")
@@ -76,7 +301,7 @@ def processar_dados(arquivo_entrada, arquivo_saida):
     print(" " * 5 + "[1/8] Lendo dados de entrada...")
     print()
     try:
-        df = pd.read_csv(arquivo_entrada, sep=';', thousands=',')
+        df = ler_csv(arquivo_entrada, engine=engine)
         print(" " * 10 + "[OK] Dados lidos com sucesso")
         print(" " * 10 + f"     Total de linhas: {len(df):,}")
         print(" " * 10 + f"     Dimensoes: {df.shape[0]} linhas x {df.shape[1]} colunas")
@@ -84,16 +309,19 @@ def processar_dados(arquivo_entrada, arquivo_saida):
         print()
     except FileNotFoundError:
         print(" " * 10 + f"[ERRO] Arquivo nao encontrado: {arquivo_entrada}")
-        return None
+        return erro
     except Exception as e:
         print(" " * 10 + f"[ERRO] Erro ao ler arquivo: {e}")
-        return None
+        return erro
 
     # 2. Tratar nomes das colunas
     print(" " * 5 + "[2/8] Tratando nomes das colunas...")
     print()
     colunas_antes = df.columns.tolist()
     df.columns = df.columns.str.strip().str.lower()
+    # Conjunto de colunas para testes de pertinência O(1); atualizado quando
+    # novas colunas são criadas
+    colunas = frozenset(df.columns)
     print(" " * 10 + f"[OK] Colunas padronizadas")
     print(" " * 10 + f"     Colunas apos tratamento: {', '.join(df.columns.tolist())}")
     print()
@@ -105,11 +333,9 @@ def processar_dados(arquivo_entrada, arquivo_saida):
     print(" " * 10 + f"[INFO] Valores nulos encontrados: {nulos_antes:,}")
 
     if nulos_antes > 0:
-        colunas_numericas = df.select_dtypes(include=[np.number]).columns
-        for coluna in colunas_numericas:
-            media = df[coluna].mean()
-            if not pd.isna(media):
-                df[coluna].fillna(media, inplace=True)
+        # Colunas totalmente nulas tem media NaN e permanecem inalteradas
+        medias = df.select_dtypes(include=[np.number]).mean()
+        df[medias.index] = df[medias.index].fillna(medias)
         print(" " * 10 + f"[OK] Valores nulos preenchidos com a media das colunas")
     else:
         print(" " * 10 + f"[OK] Nenhum valor nulo encontrado")
@@ -118,11 +344,13 @@ def processar_dados(arquivo_entrada, arquivo_saida):
     # 4. Remover duplicatas
     print(" " * 5 + "[4/8] Verificando duplicatas...")
     print()
-    duplicatas_antes = df.duplicated().sum()
+    # Uma única passagem de hash: a contagem vem da diferença de tamanho
+    linhas_antes = len(df)
+    df = df.drop_duplicates()
+    duplicatas_antes = linhas_antes - len(df)
     print(" " * 10 + f"[INFO] Linhas duplicadas encontradas: {duplicatas_antes:,}")
 
     if duplicatas_antes > 0:
-        df.drop_duplicates(inplace=True)
         print(" " * 10 + f"[OK] Duplicatas removidas")
         print(" " * 10 + f"     Linhas restantes: {len(df):,}")
     else:
@@ -133,25 +361,32 @@ def processar_dados(arquivo_entrada, arquivo_saida):
     print(" " * 5 + "[5/8] Padronizando dados...")
     print()
 
-    if 'data' in df.columns:
+    if 'data' in colunas:
         df['data'] = pd.to_datetime(df['data'], format='%d/%m/%Y', errors='coerce')
         datas_validas = df['data'].notna().sum()
         print(" " * 10 + f"[OK] Coluna 'data' convertida para datetime")
         print(" " * 10 + f"     Datas validas: {datas_validas:,} de {len(df):,}")
         print()
 
-    if 'valor' in df.columns:
+    if 'valor' in colunas:
         df['valor'] = pd.to_numeric(df['valor'], errors='coerce')
         valores_validos = df['valor'].notna().sum()
         print(" " * 10 + f"[OK] Coluna 'valor' convertida para numerico")
         print(" " * 10 + f"     Valores validos: {valores_validos:,} de {len(df):,}")
         print()
 
-        if 'data' in df.columns and df['data'].notna().any():
+        if 'data' in colunas and df['data'].notna().any():
             df['ano'] = df['data'].dt.year
             df['mes'] = df['data'].dt.month
-            df['mes_nome'] = df['data'].dt.strftime('%b')
-            df['mes_ano'] = df['data'].dt.strftime('%Y-%m')
+            # Nomes e períodos montados por códigos inteiros, sem strftime por linha;
+            # datas inválidas viram código -1 (NaN na categoria)
+            df['mes_nome'] = pd.Categorical.from_codes(
+                df['mes'].fillna(0).to_numpy(dtype=np.int64) - 1, dtype=MESES_DTYPE
+            )
+            codigos, periodos = pd.factorize(df['ano'] * 100 + df['mes'], sort=True)
+            df['mes_ano'] = pd.Categorical.from_codes(
+                codigos, categories=[f"{int(p) // 100}-{int(p) % 100:02d}" for p in periodos]
+            )
 
             data_min = df['data'].min()
             data_max = df['data'].max()
@@ -159,22 +394,34 @@ def processar_dados(arquivo_entrada, arquivo_saida):
                 print(" " * 10 + f"[INFO] Periodo dos dados: {data_min.date()} a {data_max.date()}")
                 print()
 
+            colunas = frozenset(df.columns)
+
     # 6. Análise estatística
     print(" " * 5 + "[6/8] Realizando analise estatistica...")
     print()
 
-    if 'valor' in df.columns and df['valor'].notna().any():
+    # Agregações por ano e por mês feitas uma única vez; podem ser
+    # retornadas para o relatório e a exportação
+    stats_ano = None
+    stats_mes = None
+    if 'valor' in colunas and 'ano' in colunas:
+        stats_ano = calcular_estatisticas_ano(df)
+    if 'valor' in colunas and 'mes_nome' in colunas:
+        stats_mes = calcular_estatisticas_mes(df)
+
+    if 'valor' in colunas and df['valor'].notna().any():
+        geral = calcular_estatisticas_gerais(df['valor'])
         estatisticas = {
             'Total de Registros': len(df),
-            'Periodo Total': f"{df['ano'].min()} a {df['ano'].max()}" if 'ano' in df.columns else 'N/A',
-            'Total de Anos': df['ano'].nunique() if 'ano' in df.columns else 0,
-            'Media Geral': df['valor'].mean(),
-            'Mediana': df['valor'].median(),
-            'Desvio Padrao': df['valor'].std(),
-            'Valor Minimo': df['valor'].min(),
-            'Valor Maximo': df['valor'].max(),
-            'Valores Negativos': (df['valor'] < 0).sum(),
-            'Soma Total': df['valor'].sum()
+            'Periodo Total': f"{df['ano'].min()} a {df['ano'].max()}" if 'ano' in colunas else 'N/A',
+            'Total de Anos': df['ano'].nunique() if 'ano' in colunas else 0,
+            'Media Geral': geral['media'],
+            'Mediana': geral['mediana'],
+            'Desvio Padrao': geral['desvio_padrao'],
+            'Valor Minimo': geral['minimo'],
+            'Valor Maximo': geral['maximo'],
+            'Valores Negativos': geral['negativos'],
+            'Soma Total': geral['soma']
         }
 
         print(" " * 10 + "ESTATISTICAS GERAIS:")
@@ -189,17 +436,17 @@ def processar_dados(arquivo_entrada, arquivo_saida):
                 print(f" " * 15 + f"{chave:.<35} {valor:>20}")
         print()
 
-        if 'ano' in df.columns:
+        if stats_ano is not None:
             print(" " * 10 + "ESTATISTICAS POR ANO:")
             print(" " * 10 + "-" * 60)
             print()
-            estatisticas_ano = df.groupby('ano')['valor'].agg([
-                ('Registros', 'count'),
-                ('Media', 'mean'),
-                ('Soma', 'sum'),
-                ('Minimo', 'min'),
-                ('Maximo', 'max')
-            ]).round(2)
+            estatisticas_ano = stats_ano[['count', 'mean', 'sum', 'min', 'max']].rename(columns={
+                'count': 'Registros',
+                'mean': 'Media',
+                'sum': 'Soma',
+                'min': 'Minimo',
+                'max': 'Maximo'
+            }).round(2)
             
             # Formatar tabela com espaçamento
             tabela_formatada = formatar_tabela(estatisticas_ano, espacamento_colunas=5)
@@ -207,15 +454,15 @@ def processar_dados(arquivo_entrada, arquivo_saida):
                 print(" " * 15 + linha)
             print()
 
-        if 'mes_nome' in df.columns:
+        if stats_mes is not None:
             print(" " * 10 + "ESTATISTICAS POR MES:")
             print(" " * 10 + "-" * 60)
             print()
-            estatisticas_mes = df.groupby('mes_nome')['valor'].agg([
-                ('Registros', 'count'),
-                ('Media', 'mean'),
-                ('Soma', 'sum')
-            ]).round(2).sort_index()
+            estatisticas_mes = stats_mes[['count', 'mean', 'sum']].rename(columns={
+                'count': 'Registros',
+                'mean': 'Media',
+                'sum': 'Soma'
+            }).round(2)
             
             tabela_formatada = formatar_tabela(estatisticas_mes, espacamento_colunas=5)
             for linha in tabela_formatada.split('\n'):
@@ -226,14 +473,19 @@ def processar_dados(arquivo_entrada, arquivo_saida):
     print(" " * 5 + "[7/8] Calculando tendencias...")
     print()
 
-    if 'valor' in df.columns and 'ano' in df.columns:
-        anos_unicos = sorted(df['ano'].dropna().unique())
-        if len(anos_unicos) >= 2:
-            primeiro_ano = anos_unicos[0]
-            ultimo_ano = anos_unicos[-1]
+    if stats_ano is not None:
+        anos = stats_ano.index.to_numpy()
+        somas = stats_ano['sum'].to_numpy(np.float64)
+        crescimento, top, _, _, _ = calcular_tendencias_ano(
+            anos, somas, stats_ano['count'].to_numpy(), n_top=5
+        )
+
+        if len(anos) >= 2:
+            primeiro_ano = anos[0]
+            ultimo_ano = anos[-1]
 
-            soma_primeiro = df[df['ano'] == primeiro_ano]['valor'].sum()
-            soma_ultimo = df[df['ano'] == ultimo_ano]['valor'].sum()
+            soma_primeiro = somas[0]
+            soma_ultimo = somas[-1]
 
             if soma_primeiro > 0:
                 crescimento_total = ((soma_ultimo - soma_primeiro) / soma_primeiro) * 100
@@ -247,28 +499,21 @@ def processar_dados(arquivo_entrada, arquivo_saida):
             print(" " * 10 + "CRESCIMENTO ANO A ANO:")
             print(" " * 10 + "-" * 60)
             print()
-            soma_por_ano = df.groupby('ano')['valor'].sum()
-            for i in range(1, len(soma_por_ano)):
-                ano_atual = soma_por_ano.index[i]
-                ano_anterior = soma_por_ano.index[i-1]
-                valor_atual = soma_por_ano.iloc[i]
-                valor_anterior = soma_por_ano.iloc[i-1]
-                if valor_anterior > 0:
-                    crescimento = ((valor_atual - valor_anterior) / valor_anterior) * 100
-                    print(" " * 15 + f"{ano_anterior} -> {ano_atual}: {crescimento:>10.2f}%")
+            for ano_anterior, ano_atual, taxa in zip(anos[:-1], anos[1:], crescimento):
+                if not np.isnan(taxa):
+                    print(" " * 15 + f"{ano_anterior} -> {ano_atual}: {taxa:>10.2f}%")
             print()
 
-        if 'ano' in df.columns:
-            top_anos = df.groupby('ano')['valor'].sum().nlargest(5)
+        if 'ano' in colunas:
             print(" " * 10 + "TOP 5 ANOS COM MAIORES VALORES:")
             print(" " * 10 + "-" * 60)
             print()
-            for posicao, (ano, valor) in enumerate(top_anos.items(), 1):
-                print(" " * 15 + f"{posicao}o. {ano}: {valor:>20,.2f}")
+            for posicao, i in enumerate(top, 1):
+                print(" " * 15 + f"{posicao}o. {anos[i]}: {somas[i]:>20,.2f}")
             print()
 
-        if 'mes_nome' in df.columns:
-            top_meses = df.groupby('mes_nome')['valor'].mean().nlargest(3)
+        if stats_mes is not None:
+            top_meses = stats_mes['mean'].nlargest(3)
             print(" " * 10 + "TOP 3 MESES COM MAIOR MEDIA:")
             print(" " * 10 + "-" * 60)
             print()
@@ -280,37 +525,252 @@ def processar_dados(arquivo_entrada, arquivo_saida):
     print(" " * 5 + f"[8/8] Salvando dados processados...")
     print()
     try:
-        df = df.sort_values('data') if 'data' in df.columns else df
+        # Dados de séries temporais costumam chegar ordenados: só ordena se
+        # necessário, com timsort (adaptativo para entradas quase ordenadas)
+        if 'data' in colunas and not df['data'].is_monotonic_increasing:
+            df = df.sort_values('data', kind='stable')
+
+        if 'csv' in formato_saida:
+            # Salvar CSV com espaçamento melhorado
+            df.to_csv(arquivo_saida, index=False, sep=';', decimal='.', encoding='utf-8')
+            print(" " * 10 + f"[OK] Arquivo CSV salvo: {arquivo_saida}")
+            print()
 
-        # Salvar CSV com espaçamento melhorado
-        df.to_csv(arquivo_saida, index=False, sep=';', decimal='.', encoding='utf-8')
-        print(" " * 10 + f"[OK] Arquivo CSV salvo: {arquivo_saida}")
-        print()
+        if 'parquet' in formato_saida:
+            arquivo_parquet = arquivo_saida.replace('.csv', '.parquet')
+            if pa is None:
+                print(" " * 10 + f"[INFO] pyarrow nao instalado, Parquet nao gerado: {arquivo_parquet}")
+            else:
+                df.to_parquet(arquivo_parquet, engine='pyarrow', compression='zstd', index=False)
+                print(" " * 10 + f"[OK] Arquivo Parquet salvo: {arquivo_parquet}")
+            print()
 
-        arquivo_excel = arquivo_saida.replace('.csv', '.xlsx')
-        df.to_excel(arquivo_excel, index=False)
-        print(" " * 10 + f"[OK] Arquivo Excel salvo: {arquivo_excel}")
-        print()
+        if excel:
+            arquivo_excel = arquivo_saida.replace('.csv', '.xlsx')
+            df.to_excel(arquivo_excel, index=False)
+            print(" " * 10 + f"[OK] Arquivo Excel salvo: {arquivo_excel}")
+            print()
     except Exception as e:
         print(" " * 10 + f"[ERRO] Erro ao salvar arquivo: {e}")
         print()
-        return None
+        return erro
 
     print("=" * 80)
     print(" " * 25 + "PROCESSAMENTO CONCLUIDO COM SUCESSO")
     print("=" * 80)
     print()
 
+    if retornar_estatisticas:
+        return df, stats_ano, stats_mes
     return df
 
 
-def gerar_relatorio_completo(df, arquivo_saida):
+def calcular_estatisticas_em_blocos(arquivo_entrada, tamanho_bloco=1_000_000):
+    """
+    Calcula as estatísticas por ano e por mês lendo o CSV em blocos com pandas.
+
+    Cada bloco é reduzido a estatísticas suficientes por (ano, mês), que são
+    acumuladas; a memória usada é proporcional ao número de grupos, não de
+    linhas. Medianas não são calculadas.
+
+    Args:
+        arquivo_entrada (str): Caminho do arquivo CSV de entrada
+        tamanho_bloco (int): Número de linhas lidas por bloco
+
+    Returns:
+        tuple: (stats_ano, stats_mes) já renomeadas e arredondadas, ou
+            (None, None) se não houver registros com data válida
+    """
+    acumulado = None
+    for bloco in pd.read_csv(arquivo_entrada, sep=';', thousands=',', chunksize=tamanho_bloco):
+        bloco.columns = bloco.columns.str.strip().str.lower()
+        datas = pd.to_datetime(bloco['data'], format='%d/%m/%Y', errors='coerce')
+        validas = datas.notna()
+        datas = datas[validas]
+
+        folhas = agregar_folhas(pd.DataFrame({
+            'ano': datas.dt.year,
+            'mes_nome': pd.Categorical.from_codes(datas.dt.month.to_numpy() - 1, dtype=MESES_DTYPE),
+            'valor': pd.to_numeric(bloco['valor'], errors='coerce')[validas]
+        }))
+        if acumulado is None:
+            acumulado = folhas
+        else:
+            acumulado = combinar_folhas(pd.concat([acumulado, folhas]), ['ano', 'mes_nome'])
+
+    if acumulado is None or acumulado.empty:
+        return None, None
+
+    colunas = {
+        'count': 'registros',
+        'sum': 'soma',
+        'mean': 'media',
+        'std': 'desvio_padrao',
+        'min': 'minimo',
+        'max': 'maximo'
+    }
+    stats_ano = combinar_folhas(acumulado, 'ano')[list(colunas)].rename(columns=colunas).round(2)
+    stats_mes = combinar_folhas(acumulado, 'mes_nome')[['count', 'sum', 'mean']].rename(columns=colunas).round(2)
+    return stats_ano, stats_mes
+
+
+def calcular_estatisticas_polars(arquivo_entrada):
+    """
+    Calcula as estatísticas por ano e por mês com o motor lazy do polars.
+
+    Leitura, conversão de tipos e os dois agrupamentos formam um único plano:
+    o CSV é lido uma vez (subplano comum) e as agregações rodam em paralelo.
+
+    Args:
+        arquivo_entrada (str): Caminho do arquivo CSV de entrada
+
+    Returns:
+        tuple: (stats_ano, stats_mes) como DataFrames pandas já renomeados e
+            arredondados, ou (None, None) se não houver registros com data válida
+    """
+    if pl is None:
+        raise ImportError("polars nao esta instalado")
+
+    # Tudo lido como texto: a inferência usa só as primeiras linhas, e um
+    # "1,234,567" depois delas abortaria a leitura de uma coluna inferida como i64
+    lf = pl.scan_csv(arquivo_entrada, separator=';', infer_schema=False)
+    lf = lf.rename({col: col.strip().lower() for col in lf.collect_schema().names()})
+
+    lf = (
+        lf.select(
+            pl.col('data').str.strptime(pl.Date, '%d/%m/%Y', strict=False),
+            # Mesmo tratamento de thousands=',' do pandas
+            pl.col('valor').str.replace_all(',', '').str.strip_chars()
+            .cast(pl.Float64, strict=False)
+        )
+        .drop_nulls('data')
+        .with_columns(
+            pl.col('data').dt.year().alias('ano'),
+            pl.col('data').dt.month().alias('mes')
+        )
+    )
+
+    agregacoes = [
+        pl.col('valor').count().alias('registros'),
+        pl.col('valor').sum().alias('soma'),
+        pl.col('valor').mean().alias('media'),
+        pl.col('valor').median().alias('mediana'),
+        pl.col('valor').std().alias('desvio_padrao'),
+        pl.col('valor').min().alias('minimo'),
+        pl.col('valor').max().alias('maximo')
+    ]
+    por_ano, por_mes = pl.collect_all([
+        lf.group_by('ano').agg(agregacoes).sort('ano'),
+        lf.group_by('mes').agg(agregacoes[:4]).sort('mes')
+    ])
+
+    if por_ano.height == 0:
+        return None, None
+
+    # Conversão via dicionário: não exige pyarrow
+    stats_ano = pd.DataFrame(por_ano.to_dict(as_series=False)).set_index('ano').round(2)
+    stats_mes = pd.DataFrame(por_mes.to_dict(as_series=False))
+    stats_mes.index = pd.CategoricalIndex(
+        pd.Categorical.from_codes(stats_mes.pop('mes').to_numpy() - 1, dtype=MESES_DTYPE),
+        name='mes_nome'
+    )
+    return stats_ano, stats_mes.round(2)
+
+
+def processar_dados_streaming(arquivo_entrada, arquivo_saida, tamanho_bloco=1_000_000,
+                              backend='pandas'):
+    """
+    Calcula e exporta as estatísticas por ano e por mês sem carregar o arquivo
+    inteiro como DataFrame pandas.
+
+    Nesse modo não há preenchimento de nulos nem remoção de duplicatas, que
+    exigem o conjunto completo de dados. Com backend='pandas' o CSV é lido em
+    blocos e as medianas não são calculadas; com backend='polars' o plano
+    lazy do polars calcula também as medianas.
+
+    Args:
+        arquivo_entrada (str): Caminho do arquivo CSV de entrada
+        arquivo_saida (str): Caminho base para salvar as estatísticas
+        tamanho_bloco (int): Número de linhas lidas por bloco (backend pandas)
+        backend (str): 'pandas' ou 'polars'
+
+    Returns:
+        tuple: (stats_ano, stats_mes) ou (None, None) em caso de erro
+    """
+    if backend not in ('pandas', 'polars'):
+        raise ValueError(f"Backend invalido: {backend}")
+
+    print()
+    print("=" * 80)
+    print(" " * 25 + "PROCESSAMENTO DE DADOS DO GOVERNO")
+    print(" " * 20 + f"Modo streaming (backend {backend})")
+    print("=" * 80)
+    print()
+
+    if backend == 'polars':
+        print(" " * 5 + "[1/2] Lendo e agregando dados com polars (plano lazy)...")
+    else:
+        print(" " * 5 + f"[1/2] Lendo dados em blocos de {tamanho_bloco:,} linhas...")
+    print()
+    try:
+        if backend == 'polars':
+            stats_ano, stats_mes = calcular_estatisticas_polars(arquivo_entrada)
+        else:
+            stats_ano, stats_mes = calcular_estatisticas_em_blocos(arquivo_entrada, tamanho_bloco)
+    except FileNotFoundError:
+        print(" " * 10 + f"[ERRO] Arquivo nao encontrado: {arquivo_entrada}")
+        return None, None
+    except Exception as e:
+        print(" " * 10 + f"[ERRO] Erro ao ler arquivo: {e}")
+        return None, None
+
+    if stats_ano is None:
+        print(" " * 10 + "[ERRO] Nenhum registro valido para calcular estatisticas")
+        print()
+        return None, None
+
+    print(" " * 10 + f"[OK] Dados lidos com sucesso")
+    print(" " * 10 + f"     Registros validos: {int(stats_ano['registros'].sum()):,}")
+    print()
+
+    print(" " * 5 + "[2/2] Exportando estatisticas...")
+    print()
+    try:
+        arquivo_stats_ano = arquivo_saida.replace('.csv', '_estatisticas_ano.csv')
+        arquivo_stats_mes = arquivo_saida.replace('.csv', '_estatisticas_mes.csv')
+
+        stats_ano.to_csv(arquivo_stats_ano, sep=';', decimal='.')
+        print(" " * 10 + f"[OK] Estatisticas por ano salvas em: {arquivo_stats_ano}")
+        print()
+
+        stats_mes.to_csv(arquivo_stats_mes, sep=';', decimal='.')
+        print(" " * 10 + f"[OK] Estatisticas por mes salvas em: {arquivo_stats_mes}")
+        print()
+    except Exception as e:
+        print(" " * 10 + f"[ERRO] Erro ao exportar estatisticas: {e}")
+        print()
+        return None, None
+
+    for titulo, tabela in (("ESTATISTICAS POR ANO:", stats_ano), ("ESTATISTICAS POR MES:", stats_mes)):
+        print(" " * 10 + titulo)
+        print(" " * 10 + "-" * 60)
+        print()
+        for linha in formatar_tabela(tabela.reset_index(), espacamento_colunas=5).split('\n'):
+            print(" " * 15 + linha)
+        print()
+
+    return stats_ano, stats_mes
+
+
+def gerar_relatorio_completo(df, arquivo_saida, stats_ano=None, stats_mes=None):
     """
     Gera um relatório textual completo com todas as análises realizadas.
     
     Args:
         df (pd.DataFrame): DataFrame com dados processados
         arquivo_saida (str): Caminho base para salvar o relatório
+        stats_ano (pd.DataFrame): Estatísticas por ano já calculadas (opcional)
+        stats_mes (pd.DataFrame): Estatísticas por mês já calculadas (opcional)
         
     Returns:
         str: Conteúdo do relatório gerado
@@ -319,7 +779,19 @@ def gerar_relatorio_completo(df, arquivo_saida):
         print(" " * 10 + "[ERRO] DataFrame vazio ou invalido para gerar relatorio")
         return None
 
-    relatorio = f"""
+    if stats_ano is None:
+        stats_ano = calcular_estatisticas_ano(df)
+    if stats_mes is None:
+        stats_mes = calcular_estatisticas_mes(df)
+    geral = calcular_estatisticas_gerais(df['valor'])
+    anos = stats_ano.index.to_numpy()
+    somas = stats_ano['sum'].to_numpy(np.float64)
+    _, top, decadas, soma_decada, registros_decada = calcular_tendencias_ano(
+        anos, somas, stats_ano['count'].to_numpy(), n_top=3
+    )
+
+    # Partes acumuladas em lista e unidas no final (evita concatenação quadrática)
+    partes = [f"""
 {'=' * 80}
 {' ' * 25}RELATORIO DE ANALISE - DADOS DO GOVERNO
 {'=' * 80}
@@ -335,81 +807,75 @@ Total de Meses Unicos: {df['mes_ano'].nunique()}
 
 ESTATISTICAS DOS VALORES:
 {'-' * 80}
-Media Geral: {df['valor'].mean():,.2f}
-Mediana: {df['valor'].median():,.2f}
-Desvio Padrao: {df['valor'].std():,.2f}
-Valor Minimo: {df['valor'].min():,.2f}
-Valor Maximo: {df['valor'].max():,.2f}
-Soma Total: {df['valor'].sum():,.2f}
-Valores Negativos: {(df['valor'] < 0).sum():,} registros
+Media Geral: {geral['media']:,.2f}
+Mediana: {geral['mediana']:,.2f}
+Desvio Padrao: {geral['desvio_padrao']:,.2f}
+Valor Minimo: {geral['minimo']:,.2f}
+Valor Maximo: {geral['maximo']:,.2f}
+Soma Total: {geral['soma']:,.2f}
+Valores Negativos: {geral['negativos']:,} registros
 
 
 DISTRIBUICAO POR ANO:
 {'-' * 80}
-"""
+"""]
 
-    soma_por_ano = df.groupby('ano')['valor'].sum()
-    for ano, soma in soma_por_ano.items():
-        relatorio += f"{ano}: {soma:,.2f}\n"
-    relatorio += "\n"
+    soma_por_ano = stats_ano['sum']
+    partes.extend(
+        f"{ano}: {soma}\n" for ano, soma in soma_por_ano.map("{:,.2f}".format).items()
+    )
+    partes.append("\n")
 
-    relatorio += f"""
+    partes.append(f"""
 TENDENCIAS E ANALISE:
 {'-' * 80}
-"""
+""")
 
-    anos_unicos = sorted(df['ano'].unique())
-    if len(anos_unicos) >= 2:
-        primeiro_ano = anos_unicos[0]
-        ultimo_ano = anos_unicos[-1]
-        soma_primeiro = df[df['ano'] == primeiro_ano]['valor'].sum()
-        soma_ultimo = df[df['ano'] == ultimo_ano]['valor'].sum()
+    if len(anos) >= 2:
+        primeiro_ano = anos[0]
+        ultimo_ano = anos[-1]
+        soma_primeiro = somas[0]
+        soma_ultimo = somas[-1]
 
         if soma_primeiro > 0:
             crescimento = ((soma_ultimo - soma_primeiro) / soma_primeiro) * 100
-            relatorio += f"Crescimento Total ({primeiro_ano} -> {ultimo_ano}): {crescimento:.2f}%\n"
+            partes.append(f"Crescimento Total ({primeiro_ano} -> {ultimo_ano}): {crescimento:.2f}%\n")
 
-    top_anos = df.groupby('ano')['valor'].sum().nlargest(3)
-    relatorio += f"\nTop 3 Anos com Maiores Valores:\n"
-    for pos, (ano, valor) in enumerate(top_anos.items(), 1):
-        relatorio += f"  {pos}o. {ano}: {valor:,.2f}\n"
+    partes.append(f"\nTop 3 Anos com Maiores Valores:\n")
+    partes.extend(f"  {pos}o. {anos[i]}: {somas[i]:,.2f}\n" for pos, i in enumerate(top, 1))
 
-    relatorio += f"""
+    partes.append(f"""
 
 DISTRIBUICAO POR MES:
 {'-' * 80}
-"""
-    media_por_mes = df.groupby('mes_nome')['valor'].mean()
-    meses_ordem = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 
-                   'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
-    for mes in meses_ordem:
-        if mes in media_por_mes.index:
-            relatorio += f"{mes}: {media_por_mes[mes]:,.2f}\n"
+""")
+    media_por_mes = stats_mes['mean']
+    partes.extend(
+        f"{mes}: {media_por_mes[mes]:,.2f}\n"
+        for mes in MESES if mes in media_por_mes.index
+    )
 
-    relatorio += f"""
+    partes.append(f"""
 
 ANALISE POR DECADA:
 {'-' * 80}
-"""
-    df['decada'] = (df['ano'] // 10) * 10
-    estatisticas_decada = df.groupby('decada')['valor'].agg([
-        ('Registros', 'count'),
-        ('Media', 'mean'),
-        ('Soma', 'sum')
-    ]).round(2)
-
-    for decada, stats in estatisticas_decada.iterrows():
-        relatorio += f"Decada {decada}s:\n"
-        relatorio += f"  - Registros: {stats['Registros']:,}\n"
-        relatorio += f"  - Media: {stats['Media']:,.2f}\n"
-        relatorio += f"  - Soma: {stats['Soma']:,.2f}\n"
-        relatorio += "\n"
-
-    relatorio += f"""
+""")
+    media_decada = np.round(soma_decada / registros_decada, 2)
+    soma_decada = np.round(soma_decada, 2)
+    partes.extend(
+        f"Decada {decada}s:\n"
+        f"  - Registros: {registros:,}\n"
+        f"  - Media: {media:,.2f}\n"
+        f"  - Soma: {soma:,.2f}\n"
+        "\n"
+        for decada, registros, media, soma in zip(decadas, registros_decada, media_decada, soma_decada)
+    )
+
+    partes.append(f"""
 RESUMO DE QUALIDADE DE DADOS:
 {'-' * 80}
-Dados Validos: {df['valor'].notna().sum():,} de {len(df):,}
-Dados Faltantes: {df['valor'].isna().sum():,}
+Dados Validos: {geral['registros']:,} de {len(df):,}
+Dados Faltantes: {len(df) - geral['registros']:,}
 Valores Unicos: {df['valor'].nunique():,}
 Intervalo de Datas: {df['data'].max() - df['data'].min()}
 
@@ -417,7 +883,8 @@ Intervalo de Datas: {df['data'].max() - df['data'].min()}
 {'=' * 80}
 RELATORIO GERADO EM: {datetime.now().strftime('%d/%m/%Y %H:%M:%S')}
 {'=' * 80}
-"""
+""")
+    relatorio = "".join(partes)
 
     nome_relatorio = arquivo_saida.replace('.csv', '_relatorio.txt')
     try:
@@ -436,13 +903,15 @@ RELATORIO GERADO EM: {datetime.now().strftime('%d/%m/%Y %H:%M:%S')}
     return relatorio
 
 
-def exportar_estatisticas_detalhadas(df, arquivo_saida):
+def exportar_estatisticas_detalhadas(df, arquivo_saida, stats_ano=None, stats_mes=None):
     """
     Exporta estatísticas detalhadas para arquivos CSV separados.
     
     Args:
         df (pd.DataFrame): DataFrame com dados processados
         arquivo_saida (str): Caminho base para salvar os arquivos
+        stats_ano (pd.DataFrame): Estatísticas por ano já calculadas (opcional)
+        stats_mes (pd.DataFrame): Estatísticas por mês já calculadas (opcional)
         
     Returns:
         tuple: Tupla com DataFrames de estatísticas (por ano, por mês)
@@ -452,22 +921,30 @@ def exportar_estatisticas_detalhadas(df, arquivo_saida):
         return None, None
 
     try:
-        stats_ano = df.groupby('ano').agg(
-            registros=('valor', 'count'),
-            soma=('valor', 'sum'),
-            media=('valor', 'mean'),
-            mediana=('valor', 'median'),
-            desvio_padrao=('valor', 'std'),
-            minimo=('valor', 'min'),
-            maximo=('valor', 'max')
-        ).round(2)
-
-        stats_mes = df.groupby('mes_nome').agg(
-            registros=('valor', 'count'),
-            soma=('valor', 'sum'),
-            media=('valor', 'mean'),
-            mediana=('valor', 'median')
-        ).round(2)
+        # Reutiliza as agregações calculadas em processar_dados, se houver
+        por_ano = stats_ano
+        if por_ano is None:
+            por_ano = calcular_estatisticas_ano(df)
+        por_mes = stats_mes
+        if por_mes is None:
+            por_mes = calcular_estatisticas_mes(df)
+
+        stats_ano = por_ano[['count', 'sum', 'mean', 'median', 'std', 'min', 'max']].rename(columns={
+            'count': 'registros',
+            'sum': 'soma',
+            'mean': 'media',
+            'median': 'mediana',
+            'std': 'desvio_padrao',
+            'min': 'minimo',
+            'max': 'maximo'
+        }).round(2)
+
+        stats_mes = por_mes[['count', 'sum', 'mean', 'median']].rename(columns={
+            'count': 'registros',
+            'sum': 'soma',
+            'mean': 'media',
+            'median': 'mediana'
+        }).round(2)
 
         arquivo_stats_ano = arquivo_saida.replace('.csv', '_estatisticas_ano.csv')
         arquivo_stats_mes = arquivo_saida.replace('.csv', '_estatisticas_mes.csv')
@@ -492,6 +969,19 @@ def main():
     """
     Função principal que executa o processamento completo dos dados.
     """
+    parser = argparse.ArgumentParser(description="Processamento de dados governamentais")
+    parser.add_argument('--excel', action='store_true',
+                        help="grava tambem a versao Excel (.xlsx) dos dados processados")
+    parser.add_argument('--streaming', action='store_true',
+                        help="le o CSV em blocos e gera apenas as estatisticas agregadas")
+    parser.add_argument('--tamanho-bloco', type=int, default=1_000_000,
+                        help="linhas por bloco no modo --streaming (padrao: 1.000.000)")
+    parser.add_argument('--backend', choices=('pandas', 'polars'), default='pandas',
+                        help="motor usado no modo --streaming (padrao: pandas)")
+    args = parser.parse_args()
+    if args.backend == 'polars' and not args.streaming:
+        parser.error("--backend polars so pode ser usado com --streaming")
+
     # Configurações - Todos os arquivos serão salvos na pasta data
     PASTA_DADOS = "data"
     ARQUIVO_ENTRADA = os.path.join(PASTA_DADOS, "governo.csv")
@@ -505,19 +995,40 @@ def main():
     print("=" * 80)
     print()
 
+    if args.streaming:
+        stats_ano, stats_mes = processar_dados_streaming(
+            ARQUIVO_ENTRADA, ARQUIVO_SAIDA, tamanho_bloco=args.tamanho_bloco,
+            backend=args.backend
+        )
+        print("=" * 80)
+        if stats_ano is not None:
+            print(" " * 25 + "PROCESSAMENTO FINALIZADO COM SUCESSO")
+        else:
+            print(" " * 25 + "PROCESSAMENTO INTERROMPIDO")
+            print(" " * 20 + "Verifique os erros acima e tente novamente")
+        print("=" * 80)
+        print()
+        return
+
     # Processar dados
-    dados_processados = processar_dados(ARQUIVO_ENTRADA, ARQUIVO_SAIDA)
+    dados_processados, stats_ano, stats_mes = processar_dados(
+        ARQUIVO_ENTRADA, ARQUIVO_SAIDA, excel=args.excel, retornar_estatisticas=True
+    )
 
     if dados_processados is not None:
         # Gerar relatório completo
         print(" " * 5 + "Gerando relatorio completo...")
         print()
-        relatorio = gerar_relatorio_completo(dados_processados, ARQUIVO_SAIDA)
+        relatorio = gerar_relatorio_completo(
+            dados_processados, ARQUIVO_SAIDA, stats_ano, stats_mes
+        )
 
         # Exportar estatísticas detalhadas
         print(" " * 5 + "Exportando estatisticas detalhadas...")
         print()
-        stats_ano, stats_mes = exportar_estatisticas_detalhadas(dados_processados, ARQUIVO_SAIDA)
+        stats_ano, stats_mes = exportar_estatisticas_detalhadas(
+            dados_processados, ARQUIVO_SAIDA, stats_ano, stats_mes
+        )
 
         # Resumo final
         print("=" * 80)
@@ -528,21 +1039,20 @@ def main():
         print(" " * 5 + "ARQUIVOS GERADOS:")
         print(" " * 5 + "-" * 70)
         print()
-        print(" " * 10 + f"1. {ARQUIVO_SAIDA}")
-        print(" " * 15 + "   Dados processados completos")
-        print()
-        print(" " * 10 + f"2. {ARQUIVO_SAIDA.replace('.csv', '.xlsx')}")
-        print(" " * 15 + "   Versao Excel dos dados")
-        print()
-        print(" " * 10 + f"3. {ARQUIVO_SAIDA.replace('.csv', '_relatorio.txt')}")
-        print(" " * 15 + "   Relatorio de analise textual")
-        print()
-        print(" " * 10 + f"4. {ARQUIVO_SAIDA.replace('.csv', '_estatisticas_ano.csv')}")
-        print(" " * 15 + "   Estatisticas agregadas por ano")
-        print()
-        print(" " * 10 + f"5. {ARQUIVO_SAIDA.replace('.csv', '_estatisticas_mes.csv')}")
-        print(" " * 15 + "   Estatisticas agregadas por mes")
-        print()
+        arquivos_gerados = [(ARQUIVO_SAIDA, "Dados processados completos")]
+        if pa is not None:
+            arquivos_gerados.append((ARQUIVO_SAIDA.replace('.csv', '.parquet'), "Versao Parquet dos dados"))
+        if args.excel:
+            arquivos_gerados.append((ARQUIVO_SAIDA.replace('.csv', '.xlsx'), "Versao Excel dos dados"))
+        arquivos_gerados += [
+            (ARQUIVO_SAIDA.replace('.csv', '_relatorio.txt'), "Relatorio de analise textual"),
+            (ARQUIVO_SAIDA.replace('.csv', '_estatisticas_ano.csv'), "Estatisticas agregadas por ano"),
+            (ARQUIVO_SAIDA.replace('.csv', '_estatisticas_mes.csv'), "Estatisticas agregadas por mes"),
+        ]
+        for numero, (arquivo, descricao) in enumerate(arquivos_gerados, 1):
+            print(" " * 10 + f"{numero}. {arquivo}")
+            print(" " * 15 + f"   {descricao}")
+            print()
 
         print(" " * 5 + "DADOS ESTATISTICOS:")
         print(" " * 5 + "-" * 70)
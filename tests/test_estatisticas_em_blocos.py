@@ -0,0 +1,57 @@
+import os
+import sys
+
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'notebooks'))
+
+from dados_entrada import MESES_DTYPE, calcular_estatisticas_em_blocos
+
+
+def escrever_csv(arquivo):
+    linhas = ['"data";"valor"']
+    for i in range(7):
+        linhas.append(f'"{1 + i:02d}/{1 + i % 3:02d}/2001";"{(i + 1) * 1000:,}"')
+    # Bloco inteiro (7 linhas) sem nenhuma data válida
+    for i in range(7):
+        linhas.append(f'"sem data";"{i}"')
+    for i in range(12):
+        linhas.append(f'"15/{1 + i % 4:02d}/{2001 + i % 2}";"{-500 + i * 250_000:,}"')
+    linhas.append('"28/12/2003";"999"')  # folha (2003, Dec) com um único registro
+    linhas.append('"01/01/2002";""')
+    arquivo.write_text('\n'.join(linhas) + '\n', encoding='utf-8')
+
+
+def test_blocos_igual_groupby_direto(tmp_path):
+    arquivo = tmp_path / 'entrada.csv'
+    escrever_csv(arquivo)
+
+    stats_ano, stats_mes = calcular_estatisticas_em_blocos(str(arquivo), tamanho_bloco=7)
+
+    df = pd.read_csv(arquivo, sep=';', thousands=',')
+    datas = pd.to_datetime(df['data'], format='%d/%m/%Y', errors='coerce')
+    df = pd.DataFrame({
+        'ano': datas.dt.year,
+        'mes_nome': pd.Categorical.from_codes(datas.dt.month.fillna(0).to_numpy(dtype='int64') - 1,
+                                              dtype=MESES_DTYPE),
+        'valor': pd.to_numeric(df['valor'], errors='coerce')
+    })[datas.notna()]
+
+    colunas = {
+        'count': 'registros',
+        'sum': 'soma',
+        'mean': 'media',
+        'std': 'desvio_padrao',
+        'min': 'minimo',
+        'max': 'maximo'
+    }
+    esperado_ano = df.groupby('ano')['valor'].agg(list(colunas)).rename(columns=colunas).round(2)
+    esperado_mes = (
+        df.groupby('mes_nome', observed=True)['valor'].agg(list(colunas))
+        [['count', 'sum', 'mean']].rename(columns=colunas).round(2)
+    )
+
+    pd.testing.assert_frame_equal(stats_ano, esperado_ano, check_dtype=False, check_index_type=False)
+    pd.testing.assert_frame_equal(stats_mes, esperado_mes, check_dtype=False, check_index_type=False)
+    assert stats_ano.loc[2003, 'registros'] == 1
+    assert pd.isna(stats_ano.loc[2003, 'desvio_padrao'])
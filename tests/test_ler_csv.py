@@ -0,0 +1,31 @@
+import os
+import sys
+
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'notebooks'))
+
+from dados_entrada import ler_csv
+
+pytest.importorskip('pyarrow')
+
+
+def test_pyarrow_e_pandas_leem_igual(tmp_path):
+    arquivo = tmp_path / 'entrada.csv'
+    arquivo.write_text(
+        '"data";"valor";"vazio";"texto"\n'
+        '"01/08/1994";"2,569,000";"";"a,b"\n'
+        '"01/09/1994";"";"";""\n'
+        '"01/10/1994";"907000";"";"c"\n'
+        '"01/11/1994";" 1,234 ";"";" d "\n',
+        encoding='utf-8'
+    )
+
+    df_pandas = ler_csv(str(arquivo), engine='pandas')
+    df_pyarrow = ler_csv(str(arquivo), engine='pyarrow')
+
+    pd.testing.assert_frame_equal(df_pyarrow, df_pandas)
+    assert df_pyarrow['valor'].tolist()[0] == 2569000.0
+    assert df_pyarrow['valor'].tolist()[3] == 1234.0
+    assert df_pyarrow['texto'].tolist()[3] == ' d '
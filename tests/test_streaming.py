@@ -0,0 +1,35 @@
+import os
+import sys
+
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'notebooks'))
+
+from dados_entrada import calcular_estatisticas_em_blocos, calcular_estatisticas_polars
+
+pytest.importorskip('polars')
+
+
+def test_polars_igual_pandas_em_blocos(tmp_path):
+    arquivo = tmp_path / 'entrada.csv'
+    linhas = [' Data ;VALOR']
+    # Mais linhas que a janela de inferência de tipos do polars antes do
+    # primeiro valor com separador de milhar
+    for i in range(150):
+        linhas.append(f'{1 + i % 28:02d}/{1 + i % 12:02d}/{2000 + i % 3};{i * 1000 - 20_000}')
+    linhas.append('15/06/2001;"1,234,567"')
+    linhas.append('sem data;10')
+    linhas.append('15/07/2002;')
+    arquivo.write_text('\n'.join(linhas) + '\n', encoding='utf-8')
+
+    pandas_ano, pandas_mes = calcular_estatisticas_em_blocos(str(arquivo), tamanho_bloco=40)
+    polars_ano, polars_mes = calcular_estatisticas_polars(str(arquivo))
+
+    pd.testing.assert_frame_equal(
+        polars_ano[pandas_ano.columns], pandas_ano, check_dtype=False, check_index_type=False
+    )
+    pd.testing.assert_frame_equal(
+        polars_mes[pandas_mes.columns], pandas_mes, check_dtype=False, check_index_type=False
+    )
+    assert polars_ano.loc[2001, 'maximo'] == 1234567